@@ -9,24 +9,45 @@ This server provides high-quality entropy from multiple sources including:
 - Environmental noise
 
 It serves entropy through a secure API endpoint with rate limiting and authentication.
+
+Run directly for development:
+    python entropy_server.py
+or under a production WSGI server (one pool per worker):
+    gunicorn -k gevent -w 4 -b 0.0.0.0:5000 entropy_server:app
 """
 
 import cv2
 import numpy as np
+import binascii
 import os
 import hashlib
-import random
 import time
-import uuid
+import secrets
 import threading
 import queue
 import logging
 import json
+import collections
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from flask import Flask, jsonify, request, abort
 from flask_cors import CORS
 from functools import wraps
 
+# Optional: ChaCha20 keystream for bulk pool expansion (see expand_entropy)
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
+    HAVE_CRYPTOGRAPHY = True
+except ImportError:
+    HAVE_CRYPTOGRAPHY = False
+
+# Optional: orjson serializes responses several times faster than the
+# stdlib json encoder jsonify goes through
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -46,43 +67,107 @@ API_KEYS = {
     "silent_client_dev": "development-only-key",
     # Add production keys here
 }
-
-# Find available video files
-video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm', '.wmv', '.flv', '.m4v']
+# Precomputed once so request handling doesn't rebuild a dict_values view
+_API_KEY_SET = frozenset(API_KEYS.values())
+# SHA-256 contexts pre-absorbed with each API key: the keyed signature path
+# copies the midstate and only hashes the seed portion per request.
+# Rebuild both structures if API_KEYS is ever rotated at runtime.
+_SHA_MIDSTATES = {key: hashlib.sha256(key.encode()) for key in _API_KEY_SET}
+
+# Find available video files - a tuple lets str.endswith check every
+# extension in a single C call
+VIDEO_EXT_TUPLE = ('.mp4', '.avi', '.mov', '.mkv', '.webm', '.wmv', '.flv', '.m4v')
 VIDEO_FILES = []
 
-# Dynamically find video files if they exist
+# Dynamically find video files if they exist. scandir returns names and
+# types from one getdents64 call and DirEntry paths come for free.
 if os.path.exists(VIDEO_DIR):
-    for file in os.listdir(VIDEO_DIR):
-        if any(file.lower().endswith(ext) for ext in video_extensions):
-            VIDEO_FILES.append(os.path.join(VIDEO_DIR, file))
+    with os.scandir(VIDEO_DIR) as it:
+        VIDEO_FILES = [
+            entry.path for entry in it
+            if entry.is_file() and entry.name.lower().endswith(VIDEO_EXT_TUPLE)
+        ]
     logger.info(f"Found {len(VIDEO_FILES)} video files: {[os.path.basename(v) for v in VIDEO_FILES]}")
 else:
     logger.warning(f"Video directory {VIDEO_DIR} not found. Will use system entropy only.")
     
+# Resolved once at startup so the stats endpoint doesn't re-stat every
+# video on each monitoring poll; the scan above just confirmed they exist
+AVAILABLE_VIDEO_NAMES = [os.path.basename(v) for v in VIDEO_FILES]
+
 FRAME_SKIP_RANGES = [(30, 50), (40, 60), (20, 40)]  # Random frame skipping for efficiency
 MAX_PIXELS = 15000  # Maximum pixels to sample per frame
 
+# Shared PCG64 generator for frame sampling and scheduling jitter - several
+# times faster than the legacy MT19937 global state and built once at load
+_rng = np.random.default_rng()
+
+# Probe for NVDEC-capable OpenCV builds once at startup; plain pip wheels
+# ship without the cuda/cudacodec modules, so treat any failure as "no GPU"
+try:
+    CUDA_DECODE_AVAILABLE = (
+        hasattr(cv2, "cudacodec")
+        and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    )
+except Exception:
+    CUDA_DECODE_AVAILABLE = False
+
+if CUDA_DECODE_AVAILABLE:
+    logger.info("CUDA-enabled OpenCV detected, using NVDEC for video decoding")
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-# Global entropy pool
+def json_response(payload):
+    """Builds a JSON response, bypassing jsonify when orjson is installed."""
+    if orjson is not None:
+        return app.response_class(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+# Response timestamps only need ~10ms resolution, so cache the formatted
+# string instead of paying for datetime.now().isoformat() on every request
+_ts_cache = {"t": 0.0, "s": ""}
+
+def iso_timestamp():
+    """Returns an ISO-8601 timestamp, reformatted at most once per 10ms."""
+    now = time.time()
+    if now - _ts_cache["t"] > 0.01:
+        _ts_cache["s"] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache["t"] = now
+    return _ts_cache["s"]
+
+# Global entropy pool. Consumption advances a read cursor instead of
+# reslicing the bytearray; the consumed prefix is dropped in amortized
+# batches once the cursor passes POOL_COMPACT_THRESHOLD.
 entropy_pool = bytearray()
+pool_read_cursor = 0
+POOL_COMPACT_THRESHOLD = 64 * 1024
 last_refresh_time = 0
 entropy_lock = threading.Lock()
 entropy_queue = queue.Queue(maxsize=10)  # Buffer for background processing
 refresh_in_progress = threading.Event()  # Flag to track if a refresh is in progress
 
-# Rate limiting
-request_counters = {}  # IP address -> (count, first_request_time)
+# Pre-generated seed blocks, filled by the background thread from pool
+# surplus so get_seed usually needs no entropy_lock at all
+seed_queue = queue.Queue(maxsize=1024)
+PREGEN_SEED_BYTES = 32  # SHA-256 digest length of each pre-generated block
+
+# Rate limiting - bounded LRU of IP -> (count, first_request_time) so the
+# table can't grow without limit, guarded by a lock against request races
+request_counters = collections.OrderedDict()
+request_counters_lock = threading.Lock()
 RATE_LIMIT = 100  # requests per hour
 RATE_WINDOW = 3600  # 1 hour in seconds
+RATE_TABLE_MAX_IPS = 10000  # LRU-evict beyond this many tracked IPs
 
 def require_api_key(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         api_key = request.headers.get('X-API-Key')
-        if api_key and api_key in API_KEYS.values():
+        # O(1) hashed membership gate; candidates only reach a string
+        # comparison after their hash matches, so the prefix-timing surface
+        # is negligible and the per-key compare_digest scan isn't worth it
+        if api_key and api_key in _API_KEY_SET:
             return f(*args, **kwargs)
         else:
             abort(401)  # Unauthorized
@@ -92,50 +177,131 @@ def rate_limit(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         ip = request.remote_addr
-        now = time.time()
+        # Monotonic clock - window math is immune to NTP/clock jumps
+        now = time.monotonic()
 
-        # Initialize or reset if window expired
-        if ip not in request_counters or now - request_counters[ip][1] > RATE_WINDOW:
-            request_counters[ip] = (1, now)
-            return f(*args, **kwargs)
+        with request_counters_lock:
+            # Initialize or reset if window expired
+            if ip not in request_counters or now - request_counters[ip][1] > RATE_WINDOW:
+                request_counters[ip] = (1, now)
+            else:
+                count, start_time = request_counters[ip]
+
+                # Check if rate limit exceeded
+                if count >= RATE_LIMIT:
+                    logger.warning("Rate limit exceeded for IP: %s", ip)
+                    abort(429)  # Too Many Requests
 
-        count, start_time = request_counters[ip]
+                # Increment counter
+                request_counters[ip] = (count + 1, start_time)
 
-        # Check if rate limit exceeded
-        if count >= RATE_LIMIT:
-            logger.warning(f"Rate limit exceeded for IP: {ip}")
-            abort(429)  # Too Many Requests
+            request_counters.move_to_end(ip)
+            # Evict the least recently seen IP once the table is full
+            while len(request_counters) > RATE_TABLE_MAX_IPS:
+                request_counters.popitem(last=False)
 
-        # Increment counter
-        request_counters[ip] = (count + 1, start_time)
         return f(*args, **kwargs)
     return decorated_function
 
+# One-shot SHA-256, preferring an OpenSSL-backed constructor. Normal CPython
+# builds bind hashlib to OpenSSL EVP, which auto-dispatches to SHA-NI /
+# ARMv8 SHA2 instructions; builds without OpenSSL fall back to a slow
+# generic implementation, so route those through cryptography's EVP binding
+# when the package is installed.
+try:
+    # Bind OpenSSL's constructor directly, skipping the hashlib.py wrapper
+    # and its name-based constructor cache lookup on every call
+    import _hashlib
+    _sha256 = _hashlib.openssl_sha256
+except (ImportError, AttributeError):
+    _sha256 = hashlib.sha256
+
+if hashlib.sha256.__name__ != "openssl_sha256" and HAVE_CRYPTOGRAPHY:
+    from cryptography.hazmat.primitives import hashes as _crypto_hashes
+
+    def sha256_digest(data):
+        h = _crypto_hashes.Hash(_crypto_hashes.SHA256())
+        h.update(data)
+        return h.finalize()
+
+    logger.info("hashlib built without OpenSSL - using cryptography for SHA-256")
+else:
+    def sha256_digest(data):
+        return _sha256(data).digest()
+
 def compute_hash(data, algorithm="sha256"):
     """Generates a cryptographic hash from the given data."""
     if algorithm == "sha256":
-        return hashlib.sha256(data).digest()
+        return sha256_digest(data)
     elif algorithm == "sha512":
         return hashlib.sha512(data).digest()
     else:
-        return hashlib.sha256(data).digest()
+        return sha256_digest(data)
+
+def expand_entropy(seed_material, length):
+    """Stretches seed material into length bytes of DRBG output.
+
+    Uses a ChaCha20 keystream when the cryptography package is installed -
+    OpenSSL's vectorized implementation is ~3x faster than hashing for bulk
+    output - and falls back to the SHAKE256 XOF otherwise.
+    """
+    if HAVE_CRYPTOGRAPHY:
+        key = hashlib.sha256(seed_material).digest()
+        chacha = Cipher(algorithms.ChaCha20(key, b"\0" * 16), mode=None).encryptor()
+        return chacha.update(b"\0" * length)
+    return hashlib.shake_256(seed_material).digest(length)
 
 def process_frame(frame):
-    """Extracts random pixels from the frame for entropy."""
+    """Extracts random pixels from the frame for entropy, returned as raw bytes."""
     if frame is None or frame.size == 0:
-        return []
+        return b""
 
     try:
-        # Process frame using optimal numpy operations
-        y, x, _ = frame.shape
-        # Safely handle cases where y*x < MAX_PIXELS
-        sample_size = min(MAX_PIXELS, y * x)
-        indices = np.random.choice(y * x, sample_size, replace=False)
-        sampled_pixels = frame.reshape(-1, 3)[indices]
-        return sampled_pixels.flatten().tolist()
+        # Sample with replacement - fine for entropy, and avoids the O(y*x)
+        # permutation buffer np.random.choice(replace=False) would build
+        flat = frame.reshape(-1, 3)
+        sample_size = min(MAX_PIXELS, flat.shape[0])
+        indices = _rng.integers(0, flat.shape[0], size=sample_size, dtype=np.int32)
+        return flat[indices].tobytes()
     except Exception as e:
         logger.error(f"Error processing frame: {str(e)}")
-        return []
+        return b""
+
+def sample_frames_gpu(video_path, target_indices, entropy_data, deadline):
+    """Decodes the video with NVDEC and samples the target frames.
+
+    Frames are decoded entirely on the GPU; only the sampled frames are
+    resized there and downloaded to host memory. Appends pixel bytes to
+    entropy_data and returns the number of frames sampled.
+    """
+    reader = cv2.cudacodec.createVideoReader(video_path)
+    wanted = set(int(i) for i in target_indices)
+    last_wanted = max(wanted)
+    frames_sampled = 0
+    frame_idx = 0
+
+    while frame_idx <= last_wanted:
+        if time.monotonic() > deadline:
+            logger.warning(f"Time limit reached for {video_path} after {frames_sampled} frames (GPU)")
+            break
+
+        ret, gpu_frame = reader.nextFrame()
+        if not ret:
+            break
+
+        if frame_idx in wanted:
+            gpu_small = cv2.cuda.resize(gpu_frame, (320, 180), interpolation=cv2.INTER_NEAREST)
+            frame = gpu_small.download()
+            # NVDEC emits BGRA - drop the alpha channel before sampling
+            pixel_values = process_frame(np.ascontiguousarray(frame[:, :, :3]))
+            if pixel_values:
+                entropy_data += str(frame_idx).encode()
+                entropy_data += pixel_values
+                frames_sampled += 1
+
+        frame_idx += 1
+
+    return frames_sampled
 
 def process_video(video_path, frame_skip):
     """Extracts entropy from the video using a specified frame skip interval."""
@@ -147,12 +313,13 @@ def process_video(video_path, frame_skip):
 
     cap = None
     try:
-        start_time = time.time()
+        start_time = time.monotonic()
         max_time = 10  # REDUCED from 15 to 10 seconds per video for faster processing
+        deadline = start_time + max_time
         
         logger.info(f"Opening video file: {video_path}")
         cap = cv2.VideoCapture(video_path)
-        entropy_data = []
+        entropy_data = bytearray()
 
         # Check if video was opened successfully
         if not cap.isOpened():
@@ -175,81 +342,80 @@ def process_video(video_path, frame_skip):
         
         logger.info(f"Processing video: {os.path.basename(video_path)} ({frame_count} frames, {fps:.1f} fps, {width}x{height}, limit={max_frames})")
 
-        # Set a watchdog timer to prevent hanging
-        watchdog_timer = threading.Timer(max_time + 2, lambda: cap.release() if cap and cap.isOpened() else None)
-        watchdog_timer.daemon = True
-        watchdog_timer.start()
-
-        # Process video frames with limits
-        while frames_processed < max_frames:
-            # Check if we've exceeded the time limit
-            elapsed_time = time.time() - start_time
-            if elapsed_time > max_time:
-                logger.warning(f"Time limit reached for {video_path} after {frames_processed} frames")
-                break
-                
-            # Read frame with timeout check
-            read_start = time.time()
-            ret, frame = cap.read()
-            read_time = time.time() - read_start
-            
-            # If reading a frame takes too long, bail out
-            if read_time > 0.3:  # REDUCED from 0.5 to 0.3 second for faster failure detection
-                logger.warning(f"Frame read took too long ({read_time:.2f}s), abandoning video processing")
-                break
-                
-            if not ret:
-                logger.info(f"Reached end of video after {frames_processed} frames")
-                break
-                
-            # Process this frame if it falls on our sampling interval
-            if frames_processed % frame_skip == 0:
+        # Seek straight to the frames we want instead of decoding every frame
+        # and discarding most of them. Indices are spread over the whole video
+        # and jittered by frame_skip so repeated refreshes sample differently.
+        if frame_count > 0:
+            target_indices = np.linspace(0, frame_count - 1, max_frames, dtype=np.int64)
+            target_indices = np.clip(
+                target_indices + _rng.integers(0, frame_skip, size=max_frames),
+                0, frame_count - 1
+            )
+        else:
+            target_indices = np.arange(max_frames, dtype=np.int64) * frame_skip
+
+        # Prefer the NVDEC path when the OpenCV build supports it; any GPU
+        # failure falls back to the CPU seek-and-sample loop below
+        used_gpu = False
+        if CUDA_DECODE_AVAILABLE:
+            try:
+                frames_processed = sample_frames_gpu(
+                    video_path, target_indices, entropy_data, deadline
+                )
+                used_gpu = True
+            except Exception as e:
+                logger.warning(f"GPU decode failed for {os.path.basename(video_path)}, falling back to CPU: {str(e)}")
+
+        if not used_gpu:
+            for target_idx in target_indices:
+                # Check the monotonic deadline - cheaper and more reliable
+                # than the old per-video threading.Timer watchdog
+                if time.monotonic() > deadline:
+                    logger.warning(f"Time limit reached for {video_path} after {frames_processed} frames")
+                    break
+
+                # Seek and read with timeout check
+                read_start = time.monotonic()
+                cap.set(cv2.CAP_PROP_POS_FRAMES, int(target_idx))
+                ret, frame = cap.read()
+                read_time = time.monotonic() - read_start
+
+                # If reading a frame takes too long, bail out
+                if read_time > 0.3:  # REDUCED from 0.5 to 0.3 second for faster failure detection
+                    logger.warning(f"Frame read took too long ({read_time:.2f}s), abandoning video processing")
+                    break
+
+                if not ret:
+                    logger.info(f"Reached end of video after {frames_processed} frames")
+                    break
+
+                # Downsample before sampling - we want entropy, not fidelity,
+                # and this cuts the bytes touched per frame by ~36x for 1080p
+                frame = cv2.resize(frame, (320, 180), interpolation=cv2.INTER_NEAREST)
                 # Extract random information from the frame
                 pixel_values = process_frame(frame)
                 if pixel_values:
                     # Include some metadata about the frame position - adds more entropy
-                    entropy_data.extend(str(frames_processed).encode())
-                    entropy_data.extend(pixel_values)
-                    
-            frames_processed += 1
-            
-            # Add a small pause to prevent high CPU usage and potential hanging
-            # Only add this pause every N frames
-            if frames_processed % 10 == 0:
-                time.sleep(0.001)  # 1ms pause every 10 frames
-                
-        # Cancel the watchdog timer if we completed normally
-        watchdog_timer.cancel()
-                
+                    entropy_data += str(int(target_idx)).encode()
+                    entropy_data += pixel_values
+
+                frames_processed += 1
+
         # Log statistics
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         logger.info(f"Processed {frames_processed} frames from {os.path.basename(video_path)} in {elapsed_time:.2f}s")
         
-        if len(entropy_data) == 0:
+        if not entropy_data:
             logger.warning(f"No entropy collected from {video_path}, using fallback")
             return os.urandom(1024 * 10)
-            
-        # Convert collected entropy to bytes
-        entropy_bytes = bytes(entropy_data)
+
+        # hashlib accepts the bytearray directly - no bytes() copy needed
+        entropy_bytes = entropy_data
         
-        # Hash the output to ensure good mixing of the entropy
-        if len(entropy_bytes) > 1024 * 10:  # If we have a lot of data, hash chunks
-            # Process in chunks for very large files
-            chunk_size = 1024 * 10
-            num_chunks = len(entropy_bytes) // chunk_size + (1 if len(entropy_bytes) % chunk_size else 0)
-            hashed_data = bytearray()
-            
-            for i in range(num_chunks):
-                start_idx = i * chunk_size
-                end_idx = min(start_idx + chunk_size, len(entropy_bytes))
-                chunk = entropy_bytes[start_idx:end_idx]
-                hashed_chunk = hashlib.sha256(chunk).digest()
-                hashed_data.extend(hashed_chunk)
-                
-            return bytes(hashed_data)
-        else:
-            # Direct hash for smaller amounts of data
-            return hashlib.sha256(entropy_bytes).digest() + entropy_bytes[:1024]
+        # Hash the output to ensure good mixing of the entropy. A single
+        # streaming SHA-256 mixes across the whole buffer, unlike the old
+        # per-10KB chunk hashing that kept chunks independent.
+        return hashlib.sha256(entropy_bytes).digest() + bytes(entropy_bytes[:1024])
             
     except Exception as e:
         logger.error(f"Error processing video {os.path.basename(video_path)}: {str(e)}")
@@ -258,59 +424,122 @@ def process_video(video_path, frame_skip):
         # Always make sure to release the video capture
         if cap is not None and cap.isOpened():
             cap.release()
-            
-        # Try to help with memory cleanup since OpenCV can sometimes leave resources open
-        try:
-            import gc
-            gc.collect()
-        except:
-            pass
 
 def collect_system_entropy():
     """Collects entropy from system sources."""
     system_entropy = bytearray()
 
-    # Current time at microsecond precision
-    time_bytes = str(time.time()).encode()
-    system_entropy.extend(time_bytes)
+    # Current time at nanosecond precision - packed ints avoid the string
+    # formatting the old str(time.time()) / f-string variants paid for
+    system_entropy.extend(time.time_ns().to_bytes(8, 'little'))
+    system_entropy.extend(time.perf_counter_ns().to_bytes(8, 'little'))
 
     # Process information
-    process_info = f"{os.getpid()}-{os.getppid()}-{time.process_time()}".encode()
-    system_entropy.extend(process_info)
-
-    # Random timing measurements
-    timing_entropy = bytearray()
-    for _ in range(64):
-        start = time.perf_counter_ns()
-        # Create some variability in execution time
-        _ = [random.random() for _ in range(random.randint(10, 100))]
-        end = time.perf_counter_ns()
-        # Use the least significant byte of timing difference
-        timing_entropy.append((end - start) & 0xFF)
-    system_entropy.extend(timing_entropy)
-
-    # Filesystem information (file sizes, etc.)
-    try:
-        for root, _, files in os.walk(".", topdown=True, followlinks=False):
-            if len(files) > 0:
-                sample_files = random.sample(files, min(5, len(files)))
-                for file in sample_files:
-                    path = os.path.join(root, file)
-                    try:
-                        stats = os.stat(path)
-                        stat_info = f"{stats.st_size}-{stats.st_mtime}".encode()
-                        system_entropy.extend(stat_info)
-                    except:
-                        pass
-                break  # Only process one directory
-    except:
-        pass
+    system_entropy.extend(os.getpid().to_bytes(4, 'little'))
+    system_entropy.extend(os.getppid().to_bytes(4, 'little'))
+
+    # Kernel CSPRNG output - stronger than the old timing-jitter loop and
+    # avoids allocating thousands of floats just to burn variable cycles
+    system_entropy.extend(os.urandom(64))
+
+    # Extra kernel randomness where getrandom is available (Linux) - far
+    # denser entropy per cycle than the old os.walk/os.stat sampling, which
+    # cost hundreds of syscalls for a few bits of mtime noise
+    if hasattr(os, "getrandom"):
+        try:
+            system_entropy.extend(os.getrandom(64))
+        except OSError:
+            pass
 
     # OS urandom as a backup
     system_entropy.extend(os.urandom(256))
 
     return bytes(system_entropy)
 
+def to_hex(data):
+    """Hex-encodes bytes via binascii, the faster path for short buffers."""
+    return binascii.hexlify(data).decode('ascii')
+
+def nonblocking_random(n):
+    """Draws n kernel-random bytes without risking a block on the RNG.
+
+    Uses the getrandom syscall with GRND_NONBLOCK where available, falling
+    back to os.urandom if the entropy pool isn't initialized yet or the
+    platform lacks getrandom.
+    """
+    if hasattr(os, "getrandom"):
+        try:
+            return os.getrandom(n, os.GRND_NONBLOCK)
+        except (BlockingIOError, OSError):
+            pass
+    return os.urandom(n)
+
+def mix_into_pool_locked(new_bytes):
+    """Folds fresh entropy into the pool; caller must hold entropy_lock.
+
+    Appends while the pool is below capacity, then XOR-folds any surplus
+    into the tail of the unread region with one vectorized numpy pass, so
+    fresh entropy is mixed in rather than growing the pool without bound.
+    """
+    unread = len(entropy_pool) - pool_read_cursor
+    room = ENTROPY_POOL_SIZE - unread
+    if room > 0:
+        entropy_pool.extend(new_bytes[:room])
+        new_bytes = new_bytes[room:]
+    if new_bytes:
+        n = min(len(new_bytes), len(entropy_pool) - pool_read_cursor)
+        tail = np.frombuffer(entropy_pool, dtype=np.uint8, count=n,
+                             offset=len(entropy_pool) - n)
+        tail ^= np.frombuffer(new_bytes, dtype=np.uint8, count=n)
+
+def whitened_digest(seed_bytes):
+    """SHA-256 of seed bytes plus fresh OS randomness, fed incrementally.
+
+    Streaming the two pieces into one hasher skips the intermediate
+    concatenation allocation the request path would otherwise pay.
+    """
+    h = _sha256()
+    h.update(seed_bytes)
+    h.update(os.urandom(32))
+    return h.digest()
+
+def mix_client_entropy(seed_bytes, extra_entropy, size):
+    """Mixes optional client-supplied hex entropy into seed_bytes via XOR."""
+    if extra_entropy and isinstance(extra_entropy, str):
+        try:
+            client_entropy = bytes.fromhex(extra_entropy)
+            # Ensure client_entropy is at least size bytes by repeating if necessary
+            if len(client_entropy) < size:
+                client_entropy = client_entropy * (size // len(client_entropy) + 1)
+            a = np.frombuffer(seed_bytes, dtype=np.uint8)
+            b = np.frombuffer(client_entropy[:size], dtype=np.uint8)
+            return (a ^ b).tobytes()
+        except Exception as e:
+            logger.warning(f"Failed to incorporate client entropy: {str(e)}")
+    return seed_bytes
+
+def fill_seed_queue():
+    """Pre-hashes surplus pool bytes into seed blocks for the fast path."""
+    global entropy_pool, pool_read_cursor
+
+    while not seed_queue.full():
+        with entropy_lock:
+            available = len(entropy_pool) - pool_read_cursor
+            # Keep a healthy reserve for requests served straight from the pool
+            if available < ENTROPY_POOL_SIZE // 4:
+                break
+            block = bytes(entropy_pool[pool_read_cursor:pool_read_cursor + 64])
+            pool_read_cursor += 64
+            if pool_read_cursor >= POOL_COMPACT_THRESHOLD:
+                del entropy_pool[:pool_read_cursor]
+                pool_read_cursor = 0
+
+        # Hash outside the lock - the queue itself is thread-safe
+        try:
+            seed_queue.put_nowait(whitened_digest(block))
+        except queue.Full:
+            break
+
 def generate_entropy_seed(size=64, extra_entropy=None):
     """
     Generates a seed of specified size using entropy extracted from videos
@@ -323,43 +552,47 @@ def generate_entropy_seed(size=64, extra_entropy=None):
     Returns:
         Hexadecimal string of the generated seed
     """
-    global entropy_pool, last_refresh_time
+    global entropy_pool, pool_read_cursor, last_refresh_time
 
-    with entropy_lock:
-        current_time = time.time()
-
-        # Check if we need to refresh the entropy pool
-        if len(entropy_pool) < size * 2 or current_time - last_refresh_time > REFRESH_INTERVAL:
-            refresh_entropy_pool()
+    # Fast path: a pre-hashed block from the producer queue serves typical
+    # requests without ever touching entropy_lock
+    if size <= PREGEN_SEED_BYTES:
+        try:
+            block = seed_queue.get_nowait()
+        except queue.Empty:
+            block = None
+        if block is not None:
+            seed_bytes = mix_client_entropy(block[:size], extra_entropy, size)
+            return to_hex(whitened_digest(seed_bytes)[:size])
 
-        # Create a seed from the entropy pool
-        if len(entropy_pool) >= size:
-            # Take bytes from the pool
-            seed_bytes = entropy_pool[:size]
-            # Remove used bytes from the pool
-            entropy_pool = entropy_pool[size:]
+    with entropy_lock:
+        available = len(entropy_pool) - pool_read_cursor
+
+        # Create a seed from the entropy pool. Refills happen in the
+        # background thread; a depleted pool falls through to the
+        # emergency branch below rather than refreshing inline.
+        if available >= size:
+            # Take bytes at the cursor - O(size) instead of the O(pool)
+            # copy the old entropy_pool[size:] reslice did per request
+            seed_bytes = bytes(entropy_pool[pool_read_cursor:pool_read_cursor + size])
+            pool_read_cursor += size
+            # Drop the consumed prefix in one amortized pass
+            if pool_read_cursor >= POOL_COMPACT_THRESHOLD:
+                del entropy_pool[:pool_read_cursor]
+                pool_read_cursor = 0
 
             # If extra entropy is provided, mix it in
-            if extra_entropy and isinstance(extra_entropy, str):
-                try:
-                    client_entropy = bytes.fromhex(extra_entropy)
-                    # Ensure client_entropy is at least size bytes by repeating if necessary
-                    if len(client_entropy) < size:
-                        client_entropy = client_entropy * (size // len(client_entropy) + 1)
-                    # XOR the first 'size' bytes of client_entropy with seed_bytes
-                    seed_bytes = bytes(a ^ b for a, b in zip(seed_bytes, client_entropy[:size]))
-                except Exception as e:
-                    logger.warning(f"Failed to incorporate client entropy: {str(e)}")
+            seed_bytes = mix_client_entropy(seed_bytes, extra_entropy, size)
 
             # Final hash to ensure good statistical properties
-            seed = compute_hash(seed_bytes + os.urandom(32), "sha256")[:size]
-            return seed.hex()
+            seed = whitened_digest(seed_bytes)[:size]
+            return to_hex(seed)
         else:
-            # Emergency fallback
+            # Emergency fallback - SHAKE256 squeezes exactly size bytes, so
+            # large requests aren't silently truncated to one sha256 digest
             logger.warning("Entropy pool depleted, using emergency entropy")
-            fallback = os.urandom(size)
-            seed = compute_hash(fallback, "sha256")[:size]
-            return seed.hex()
+            seed = hashlib.shake_256(os.urandom(size)).digest(size)
+            return to_hex(seed)
 
 def refresh_entropy_pool():
     """Rebuilds the entropy pool from video sources and system entropy."""
@@ -380,70 +613,52 @@ def refresh_entropy_pool():
         # Add some initial entropy to the pool immediately
         with entropy_lock:
             initial_entropy = compute_hash(system_entropy + os.urandom(32), "sha512")
-            entropy_pool.extend(initial_entropy)
+            mix_into_pool_locked(initial_entropy)
             logger.info(f"Added {len(initial_entropy)} bytes of initial entropy to pool")
 
         # 2. Process videos for entropy if available
         if VIDEO_FILES:
             # Use all available videos in the directory
             videos_to_process = VIDEO_FILES.copy()
-            random.shuffle(videos_to_process)  # Process in random order for better entropy
+            _rng.shuffle(videos_to_process)  # Process in random order for better entropy
             
             logger.info(f"Planning to process these videos: {[os.path.basename(v) for v in videos_to_process]}")
-            
-            # Process each video sequentially
+
+            # Process videos in parallel - cv2.VideoCapture.read() and the
+            # numpy sampling both release the GIL, so the workers overlap
+            executor = ThreadPoolExecutor(
+                max_workers=min(4, len(videos_to_process)),
+                thread_name_prefix="VideoEntropy"
+            )
+            futures = {}
             for i, video in enumerate(videos_to_process):
-                # Check if we've exceeded the max refresh time
-                elapsed_time = time.time() - start_time
-                remaining_time = max_refresh_time - elapsed_time
-                if remaining_time <= 0:
-                    logger.warning(f"Max refresh time reached ({max_refresh_time}s), skipping remaining videos")
-                    break
-                    
-                frame_skip = random.randint(*FRAME_SKIP_RANGES[i % len(FRAME_SKIP_RANGES)])
-                logger.info(f"Processing video {i+1} of {len(videos_to_process)}: {os.path.basename(video)} with frame_skip={frame_skip}...")
-                
-                try:
-                    # Use a separate thread with a timeout to process the video
-                    # This ensures a single video can't hang the entire process
-                    video_result = [None]  # Use a list to store the result from the thread
-                    
-                    def process_video_with_timeout():
-                        video_result[0] = process_video(video, frame_skip)
-                    
-                    video_thread = threading.Thread(target=process_video_with_timeout)
-                    video_thread.daemon = True
-                    video_thread.start()
-                    
-                    # Set a timeout for this single video processing
-                    # Use a shorter timeout for later videos to ensure we can process all videos
-                    video_timeout = min(25, remaining_time - 5)  # max 25 seconds per video, with 5 second buffer
-                    video_thread.join(timeout=video_timeout)
-                    
-                    if video_thread.is_alive():
-                        logger.warning(f"Video processing thread for {os.path.basename(video)} appears to be hung. Skipping.")
+                skip_lo, skip_hi = FRAME_SKIP_RANGES[i % len(FRAME_SKIP_RANGES)]
+                frame_skip = int(_rng.integers(skip_lo, skip_hi + 1))
+                futures[executor.submit(process_video, video, frame_skip)] = video
+            try:
+                remaining_time = max(max_refresh_time - (time.time() - start_time), 1)
+                for future in as_completed(futures, timeout=remaining_time):
+                    video = futures[future]
+                    try:
+                        video_data = future.result() or os.urandom(1024 * 10)
+                    except Exception as e:
+                        logger.error(f"Error processing video {os.path.basename(video)}: {str(e)}")
                         video_data = os.urandom(1024 * 10)  # Fallback entropy
-                        
-                        # Attempt to help with thread cleanup
-                        try:
-                            import gc
-                            gc.collect()
-                        except:
-                            pass
-                    else:
-                        video_data = video_result[0] or os.urandom(1024 * 10)
-                    
+
                     all_entropy.extend(video_data)
                     logger.info(f"Collected {len(video_data)} bytes from {os.path.basename(video)}")
-                    
+
                     # Add some entropy from this video to the pool immediately
                     with entropy_lock:
                         video_hash = compute_hash(video_data, "sha512")
-                        entropy_pool.extend(video_hash)
+                        mix_into_pool_locked(video_hash)
                         logger.info(f"Added {len(video_hash)} bytes from {os.path.basename(video)} to pool")
-                except Exception as e:
-                    logger.error(f"Error processing video {os.path.basename(video)}: {str(e)}")
-                    # Continue with next video instead of failing the entire process
+            except FuturesTimeoutError:
+                logger.warning(f"Max refresh time reached ({max_refresh_time}s), skipping remaining videos")
+            finally:
+                # Don't block on stragglers - they are daemon-style workers
+                # whose results we no longer need
+                executor.shutdown(wait=False, cancel_futures=True)
         else:
             logger.warning("No video files available. Using system randomness only.")
             # Add more system randomness as compensation
@@ -452,20 +667,22 @@ def refresh_entropy_pool():
             logger.info(f"Added {len(extra_randomness)} bytes of extra system randomness as fallback")
 
         # 3. Add timestamp to prevent replays
-        timestamp = str(datetime.now().isoformat()).encode()
-        all_entropy.extend(timestamp)
+        all_entropy.extend(time.time_ns().to_bytes(8, 'little'))
 
         # 4. Final hash of all entropy
         final_entropy = compute_hash(all_entropy, "sha512")
         with entropy_lock:
-            entropy_pool.extend(final_entropy)
-
-            # For larger entropy pool needs, we can generate more
-            while len(entropy_pool) < ENTROPY_POOL_SIZE:
-                # Generate new entropy with previous hash as seed
-                hash_input = final_entropy + os.urandom(32) + str(random.random()).encode()
-                final_entropy = compute_hash(hash_input, "sha512")
-                entropy_pool.extend(final_entropy)
+            mix_into_pool_locked(final_entropy)
+
+            # For larger entropy pool needs, stretch the seed material with
+            # the DRBG - one call produces the whole remainder instead of
+            # ~16k chained SHA-512 rounds with per-iteration concatenation
+            unread = len(entropy_pool) - pool_read_cursor
+            if unread < ENTROPY_POOL_SIZE:
+                entropy_pool.extend(expand_entropy(
+                    final_entropy + os.urandom(32),
+                    ENTROPY_POOL_SIZE - unread
+                ))
 
             # Update the last refresh timestamp
             last_refresh_time = time.time()
@@ -490,107 +707,95 @@ def background_entropy_refresh():
     
     while True:
         try:
-            # Check if we need to refresh the entropy pool
+            # Check if we need to refresh the entropy pool. Only the checks
+            # run under the lock - refresh_entropy_pool takes entropy_lock
+            # itself, so holding it across the trigger would deadlock.
             with entropy_lock:
                 current_time = time.time()
-                pool_low = len(entropy_pool) < ENTROPY_POOL_SIZE // 2
+                pool_low = len(entropy_pool) - pool_read_cursor < ENTROPY_POOL_SIZE // 2
                 refresh_due = current_time - last_refresh_time > REFRESH_INTERVAL
-                time_since_last_attempt = current_time - last_refresh_attempt
-                
-                # Prevent constant retries if refresh is failing
-                if consecutive_failures > 3 and time_since_last_attempt < 120:
-                    logger.warning(f"Skipping refresh due to {consecutive_failures} consecutive failures, next attempt in {120 - time_since_last_attempt:.0f}s")
-                    time.sleep(30)
-                    continue
-                
-                # Only trigger a refresh if one is not already in progress
-                if (pool_low or refresh_due) and not refresh_in_progress.is_set():
-                    logger.info(f"Background refresh triggered: pool low={pool_low}, refresh due={refresh_due}")
-                    
-                    # Update last attempt time
-                    last_refresh_attempt = current_time
-                    
-                    # Set the flag to indicate a refresh is in progress
-                    refresh_in_progress.set()
-                    
-                    # Create a cancellation event for the refresh thread
-                    cancel_refresh = threading.Event()
-                    
-                    # Start a separate thread with timeout to prevent hanging
-                    def refresh_with_cleanup():
-                        try:
-                            # Set a watchdog timer as a failsafe
-                            watchdog_timer = threading.Timer(75, lambda: cancel_refresh.set())
-                            watchdog_timer.daemon = True
-                            watchdog_timer.start()
-                            
-                            refresh_entropy_pool()
-                            
-                            # Only decrement failures if successful
-                            nonlocal consecutive_failures
-                            consecutive_failures = max(0, consecutive_failures - 1)
-                            
-                            # Cancel the watchdog timer if refresh completes successfully
-                            watchdog_timer.cancel()
-                        except Exception as e:
-                            logger.error(f"Uncaught error in refresh thread: {str(e)}")
-                            consecutive_failures += 1
-                            
-                            # Add emergency entropy if the refresh failed
-                            with entropy_lock:
-                                emergency_entropy = os.urandom(1024 * 20)  # 20KB emergency entropy
-                                entropy_pool.extend(emergency_entropy)
-                                last_refresh_time = time.time()
-                                logger.info(f"Added {len(emergency_entropy)} bytes of emergency entropy due to refresh error")
-                        finally:
-                            # Clear the flag when the refresh is done
-                            refresh_in_progress.clear()
-                            
-                            # Clean up resources to help prevent leaks
-                            try:
-                                cv2.destroyAllWindows()
-                                import gc
-                                gc.collect()
-                            except:
-                                pass
-                    
-                    # Use a tighter refresh timeout (75 seconds total)
-                    refresh_thread = threading.Thread(target=refresh_with_cleanup, name="EntropyRefresh")
-                    refresh_thread.daemon = True
-                    refresh_thread.start()
-                    
-                    # Set a timeout to prevent hanging indefinitely
-                    refresh_thread.join(timeout=75)  # REDUCED from 90 to 75 seconds
-                    
-                    if refresh_thread.is_alive():
-                        logger.error("Entropy refresh thread appears to be hung. Using emergency entropy.")
-                        
-                        # Signal the thread to cancel
-                        cancel_refresh.set()
-                        
-                        # Add emergency entropy immediately without waiting for thread
-                        emergency_entropy = os.urandom(1024 * 64)  # 64KB emergency entropy
+
+            time_since_last_attempt = current_time - last_refresh_attempt
+
+            # Prevent constant retries if refresh is failing
+            if consecutive_failures > 3 and time_since_last_attempt < 120:
+                logger.warning(f"Skipping refresh due to {consecutive_failures} consecutive failures, next attempt in {120 - time_since_last_attempt:.0f}s")
+                time.sleep(30)
+                continue
+
+            # Only trigger a refresh if one is not already in progress
+            if (pool_low or refresh_due) and not refresh_in_progress.is_set():
+                logger.info(f"Background refresh triggered: pool low={pool_low}, refresh due={refresh_due}")
+
+                # Update last attempt time
+                last_refresh_attempt = current_time
+
+                # Set the flag to indicate a refresh is in progress
+                refresh_in_progress.set()
+
+                # Start a separate thread with timeout to prevent hanging
+                def refresh_with_cleanup():
+                    try:
+                        refresh_entropy_pool()
+
+                        # Only decrement failures if successful
+                        nonlocal consecutive_failures
+                        consecutive_failures = max(0, consecutive_failures - 1)
+                    except Exception as e:
+                        logger.error(f"Uncaught error in refresh thread: {str(e)}")
+                        consecutive_failures += 1
+
+                        # Add emergency entropy if the refresh failed
                         with entropy_lock:
+                            emergency_entropy = os.urandom(1024 * 20)  # 20KB emergency entropy
                             entropy_pool.extend(emergency_entropy)
                             last_refresh_time = time.time()
-                            logger.info(f"Added {len(emergency_entropy)} bytes of emergency entropy due to timeout")
-                        
-                        # Increment failure counter
-                        consecutive_failures += 1
-                        
-                        # Clear the refresh flag even if the thread is still running
+                            logger.info(f"Added {len(emergency_entropy)} bytes of emergency entropy due to refresh error")
+                    finally:
+                        # Clear the flag when the refresh is done
                         refresh_in_progress.clear()
-                        
-                        # Try to forcibly clean up any hanging resources
+
+                        # Clean up resources to help prevent leaks
                         try:
                             cv2.destroyAllWindows()
-                            import gc
-                            gc.collect()
                         except:
                             pass
 
+                # Use a tighter refresh timeout (75 seconds total)
+                refresh_thread = threading.Thread(target=refresh_with_cleanup, name="EntropyRefresh")
+                refresh_thread.daemon = True
+                refresh_thread.start()
+
+                # Set a timeout to prevent hanging indefinitely
+                refresh_thread.join(timeout=75)  # REDUCED from 90 to 75 seconds
+
+                if refresh_thread.is_alive():
+                    logger.error("Entropy refresh thread appears to be hung. Using emergency entropy.")
+
+                    # Add emergency entropy immediately without waiting for thread
+                    emergency_entropy = os.urandom(1024 * 64)  # 64KB emergency entropy
+                    with entropy_lock:
+                        entropy_pool.extend(emergency_entropy)
+                        last_refresh_time = time.time()
+                        logger.info(f"Added {len(emergency_entropy)} bytes of emergency entropy due to timeout")
+
+                    # Increment failure counter
+                    consecutive_failures += 1
+
+                    # Clear the refresh flag even if the thread is still running
+                    refresh_in_progress.clear()
+
+                    # Try to forcibly clean up any hanging resources
+                    try:
+                        cv2.destroyAllWindows()
+                    except:
+                        pass
+
+            # Keep the fast-path queue of pre-generated seeds topped up
+            fill_seed_queue()
+
             # Sleep for a while before checking again - use adaptive sleep based on pool size and failure rate
-            pool_ratio = len(entropy_pool) / ENTROPY_POOL_SIZE if ENTROPY_POOL_SIZE > 0 else 0
+            pool_ratio = (len(entropy_pool) - pool_read_cursor) / ENTROPY_POOL_SIZE if ENTROPY_POOL_SIZE > 0 else 0
             
             # Calculate adaptive sleep time based on pool fullness and failure history
             if consecutive_failures > 5:
@@ -627,7 +832,7 @@ def background_entropy_refresh():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring."""
-    return jsonify({"status": "ok", "timestamp": datetime.now().isoformat()})
+    return json_response({"status": "ok", "timestamp": iso_timestamp()})
 
 @app.route('/api/get-seed', methods=['POST'])
 @require_api_key
@@ -644,9 +849,9 @@ def get_seed():
         purpose = data.get('purpose', 'general')
 
         # Add request context to logs
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
         request_ip = request.remote_addr
-        logger.info(f"Seed request {request_id} from {request_ip}: size={seed_size}, purpose={purpose}")
+        logger.info("Seed request %s from %s: size=%d, purpose=%s", request_id, request_ip, seed_size, purpose)
 
         # Use a faster response path for login/startup purposes to prevent app hangs
         is_critical_path = purpose in ['login', 'startup', 'initialization', 'immediate']
@@ -656,7 +861,7 @@ def get_seed():
         
         # For critical path requests during refresh, respond faster with emergency entropy
         if is_critical_path and pool_is_refreshing:
-            logger.info(f"Critical path request {request_id} during pool refresh - using fast path response")
+            logger.info("Critical path request %s during pool refresh - using fast path response", request_id)
             
             # Generate emergency entropy that's still cryptographically secure
             emergency_seed = os.urandom(seed_size)
@@ -665,88 +870,112 @@ def get_seed():
             if client_entropy:
                 try:
                     client_bytes = bytes.fromhex(client_entropy)
-                    mixed_seed = bytearray(seed_size)
-                    for i in range(min(len(client_bytes), seed_size)):
-                        mixed_seed[i] = emergency_seed[i] ^ client_bytes[i % len(client_bytes)]
-                    emergency_seed = bytes(mixed_seed)
+                    # Tile client entropy to seed_size and XOR in one vectorized pass
+                    a = np.frombuffer(emergency_seed, dtype=np.uint8)
+                    b = np.tile(np.frombuffer(client_bytes, dtype=np.uint8),
+                                seed_size // len(client_bytes) + 1)[:seed_size]
+                    emergency_seed = (a ^ b).tobytes()
                 except Exception as e:
                     logger.error(f"Error mixing client entropy: {str(e)}")
                     # Continue with just the emergency entropy
             
-            # Hash the result for good measure
-            final_seed = compute_hash(emergency_seed, "sha256")[:seed_size]
+            # Hash the result for good measure. SHAKE256 squeezes exactly
+            # seed_size bytes - no truncation waste below 32 bytes, and
+            # requests above 32 bytes get full-length output instead of
+            # the short seed the old sha256[:seed_size] slice produced
+            final_seed = hashlib.shake_256(emergency_seed).digest(seed_size)
             
             # Return a special response indicating this was emergency entropy
             response = {
-                "seed": final_seed.hex(),
-                "timestamp": datetime.now().isoformat(),
-                "signature": hashlib.sha256(final_seed).hexdigest(),
+                "seed": to_hex(final_seed),
+                "timestamp": iso_timestamp(),
+                "signature": to_hex(sha256_digest(final_seed)),
                 "requestId": request_id,
                 "prefetchDuringRefresh": True
             }
             
             elapsed = time.time() - start_time
-            logger.info(f"Fast path seed request {request_id} fulfilled in {elapsed:.3f}s")
-            return jsonify(response)
+            logger.info("Fast path seed request %s fulfilled in %.3fs", request_id, elapsed)
+            return json_response(response)
 
         # Standard path - generate the seed from the entropy pool
         seed = generate_entropy_seed(seed_size, client_entropy)
 
-        # Return the seed with a signature for verification
+        # Return the seed with a signature for verification. For keyed
+        # requests, copy the pre-absorbed key midstate so only the seed
+        # bytes are hashed per request.
         api_key = request.headers.get('X-API-Key', '')
-        signature_base = seed
-        if api_key in API_KEYS.values():
-            signature_base = seed + api_key
-
-        signature = hashlib.sha256(signature_base.encode()).hexdigest()
+        midstate = _SHA_MIDSTATES.get(api_key)
+        if midstate is not None:
+            ctx = midstate.copy()
+            ctx.update(seed.encode())
+            signature = ctx.hexdigest()
+        else:
+            signature = to_hex(sha256_digest(seed.encode()))
         response = {
             "seed": seed,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_timestamp(),
             "signature": signature,
             "requestId": request_id
         }
 
         elapsed = time.time() - start_time
-        logger.info(f"Seed request {request_id} fulfilled in {elapsed:.3f}s")
-        return jsonify(response)
+        logger.info("Seed request %s fulfilled in %.3fs", request_id, elapsed)
+        return json_response(response)
     except Exception as e:
         logger.error(f"Error generating seed: {str(e)}")
 
         # Return a proper fallback response that client can handle
-        fallback_seed = os.urandom(seed_size).hex()
+        fallback_seed = to_hex(nonblocking_random(seed_size))
         response = {
             "seed": fallback_seed,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_timestamp(),
             "signature": "fallback",
-            "requestId": str(uuid.uuid4()),
+            "requestId": secrets.token_hex(16),
             "fallback": True,
             "error": str(e)
         }
-        return jsonify(response)
+        return json_response(response)
 
 @app.route('/api/entropy-stats', methods=['GET'])
 @require_api_key
 def entropy_stats():
     """Returns statistics about the entropy pool (for monitoring)."""
-    with entropy_lock:
-        pool_size = len(entropy_pool)
-        last_refresh = datetime.fromtimestamp(last_refresh_time).isoformat() if last_refresh_time > 0 else None
+    # Lock-free reads: len() and the cursor are each read atomically under
+    # the GIL, and monitoring tolerates a momentarily stale value, so stats
+    # polls no longer contend with seed traffic and the refresher
+    pool_size = max(len(entropy_pool) - pool_read_cursor, 0)
+    last_refresh = datetime.fromtimestamp(last_refresh_time).isoformat() if last_refresh_time > 0 else None
 
     stats = {
         "poolSize": pool_size,
         "poolCapacity": ENTROPY_POOL_SIZE,
         "poolUtilization": pool_size / ENTROPY_POOL_SIZE if ENTROPY_POOL_SIZE > 0 else 0,
         "lastRefresh": last_refresh,
-        "videoSources": [os.path.basename(v) for v in VIDEO_FILES if os.path.exists(v)],
-        "timestamp": datetime.now().isoformat()
+        "videoSources": AVAILABLE_VIDEO_NAMES,
+        "timestamp": iso_timestamp()
     }
 
-    return jsonify(stats)
+    return json_response(stats)
+
+_service_started = threading.Event()
+
+def start_entropy_service():
+    """Bootstraps the entropy pool and background threads, exactly once.
+
+    Runs at import so production WSGI servers (gunicorn/uwsgi workers) get
+    a seeded pool and a running refresher without the __main__ block; each
+    worker keeps its own pool.
+    """
+    global last_refresh_time
+
+    if _service_started.is_set():
+        return
+    _service_started.set()
 
-if __name__ == "__main__":
     # Ensure the video directory exists
     os.makedirs(VIDEO_DIR, exist_ok=True)
-    
+
     # Print the available video files
     available_videos = [v for v in VIDEO_FILES if os.path.exists(v)]
     logger.info(f"Available videos: {[os.path.basename(v) for v in available_videos]}")
@@ -759,10 +988,10 @@ if __name__ == "__main__":
         entropy_pool.extend(initial_entropy)
         last_refresh_time = time.time()
         logger.info(f"Added {len(initial_entropy)} bytes of initial entropy to bootstrap the system")
-    
+
     # Start the initial refresh in a separate thread
     refresh_in_progress.set()  # Set the flag to indicate a refresh is in progress
-    
+
     def initial_refresh():
         try:
             logger.info("Starting initial entropy pool refresh...")
@@ -773,15 +1002,18 @@ if __name__ == "__main__":
         finally:
             # Always clear the flag when done
             refresh_in_progress.clear()
-    
-    init_thread = threading.Thread(target=initial_refresh, name="InitialRefresh")
-    init_thread.daemon = True
+
+    init_thread = threading.Thread(target=initial_refresh, name="InitialRefresh", daemon=True)
     init_thread.start()
-    
+
     # Start background thread for ongoing entropy collection
     bg_thread = threading.Thread(target=background_entropy_refresh, name="BackgroundRefresh", daemon=True)
     bg_thread.start()
 
-    # Always run in HTTP mode
+start_entropy_service()
+
+if __name__ == "__main__":
+    # Development server only - run production deployments behind a real
+    # WSGI server, e.g.: gunicorn -k gevent -w 4 -b 0.0.0.0:5000 entropy_server:app
     logger.info("Starting entropy server on port 5000 with HTTP")
     app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
\ No newline at end of file